@@ -1,12 +1,27 @@
 import obd
+import threading
 import time
 
+OBD_POLL_INTERVAL = 0.05 # Seconds between background OBD queries
+
+# Volume curves: bass rides on RPM, the other stems fade in at staggered speeds
+BASS_RPM_RANGE = 7000
+STEM_SPEED_RANGE = 70 # MPH
+_BASS_RPM_SCALE = 1 / BASS_RPM_RANGE
+_STEM_SPEED_SCALE = 7 / STEM_SPEED_RANGE
+
 class OBDHandler():
     def __init__(self, simulate=False, port="COM4"): # Added simulate and port arguments
         self.simulate = simulate
         self.connection = None
+        # Never None: failed queries keep the last value and refresh() skips missing sim values
         self.speed = 0  # mph
         self.rpm = 0
+        self._poll_thread = None
+        self._stop_polling = threading.Event()
+        # Last (speed in 0.1 MPH, whole RPM) key and the volumes computed for it
+        self._last_vol_key = None
+        self._last_vols = None
 
         if self.simulate:
             print("OBDHandler initialized in simulation mode.")
@@ -23,6 +38,9 @@ class OBDHandler():
                     # Initialize with actual values if possible, or default to 0
                     self.rpm = self._query_rpm()
                     self.speed = self._query_speed()
+                    # ELM327 round trips take tens of ms, so keep them off the render loop
+                    self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+                    self._poll_thread.start()
             except Exception as e:
                 print(f"Error connecting to OBD on port {port}: {e}. Switching to simulation mode.")
                 self.simulate = True # Fallback to simulation
@@ -50,73 +68,76 @@ class OBDHandler():
                 print("Warning: OBD RPM query returned null or no value.")
         return self.rpm # Return current or default if query fails
 
+    def _poll_loop(self):
+        """Background loop that keeps speed and RPM fresh from the OBD device.
+           Plain attribute assignment is atomic, so readers see either the old or new value."""
+        while not self._stop_polling.is_set():
+            if self.connection and self.connection.is_connected():
+                self.rpm = self._query_rpm()
+                self.speed = self._query_speed()
+            self._stop_polling.wait(OBD_POLL_INTERVAL)
+
     def get_speed(self):
         """Returns the current speed. In simulation mode, this is the simulated speed.
            In real mode, this is the last fetched speed."""
-        return self.speed if self.speed is not None else 0
+        return self.speed
 
     def get_rpm(self):
         """Returns the current RPM. In simulation mode, this is the simulated RPM.
            In real mode, this is the last fetched RPM."""
-        return self.rpm if self.rpm is not None else 0
+        return self.rpm
     
     def refresh(self, sim_speed=None, sim_rpm=None):
         """
         Refreshes speed and RPM.
         In simulation mode, updates with provided sim_speed and sim_rpm.
-        In real OBD mode, queries the OBD device.
+        In real OBD mode, the background poller already keeps values current,
+        and if the connection is lost they remain at the last known values.
         """
         if self.simulate:
             if sim_speed is not None:
                 self.speed = sim_speed
             if sim_rpm is not None:
                 self.rpm = sim_rpm
-        else:
-            if self.connection and self.connection.is_connected():
-                self.rpm = self._query_rpm()
-                self.speed = self._query_speed()
-            else:
-                # If connection lost or was never properly established
-                # print("OBD not connected. Cannot refresh real data. Using last known values or 0.")
-                # Values will remain as they are, or default to 0 if they were None
-                if self.speed is None: self.speed = 0
-                if self.rpm is None: self.rpm = 0
     
     def get_bass_volume(self):
-        current_rpm = self.rpm if self.rpm is not None else 0
-        bass_percent = current_rpm / 7000 if 7000 > 0 else 0
-        bass_volume = min(bass_percent + 0.5, 1)
-        return bass_volume
+        return self.get_volumes()[0]
     
     def get_drums_volume(self):
-        current_speed = self.speed if self.speed is not None else 0
-        drums_percent = current_speed / 70 if 70 > 0 else 0
-        drums_volume = max(min(drums_percent * 7 - 1, 1), 0)
-        return drums_volume
+        return self.get_volumes()[1]
 
     def get_other_volume(self):
-        current_speed = self.speed if self.speed is not None else 0
-        other_percent = current_speed / 70 if 70 > 0 else 0
-        other_volume = max(min(other_percent * 7 - 2.5, 1), 0)
-        return other_volume
+        return self.get_volumes()[2]
     
-    def get_vocals_volume(self): # Assuming this method exists as per your full file
-        current_speed = self.speed if self.speed is not None else 0
-        vocals_percent = current_speed / 70 if 70 > 0 else 0
-        vocals_volume = max(min(vocals_percent * 7 - 4, 1), 0)
-        return vocals_volume
+    def get_vocals_volume(self):
+        return self.get_volumes()[3]
     
     def get_volumes(self):
-        volumes = [
-            self.get_bass_volume(),
-            self.get_drums_volume(),
-            self.get_other_volume(),
-            self.get_vocals_volume() # Assuming this exists
-        ]
+        """Returns (bass, drums, other, vocals) volumes in 0-1.
+           Bass follows RPM; the other stems fade in one after another as speed rises.
+           A tuple, since the same object is cached and handed back while readings hold steady."""
+        current_speed = self.speed
+        current_rpm = self.rpm
+        key = (int(current_speed * 10), int(current_rpm))
+        if key == self._last_vol_key:
+            return self._last_vols
+        speed_level = current_speed * _STEM_SPEED_SCALE
+        volumes = (
+            min(current_rpm * _BASS_RPM_SCALE + 0.5, 1),
+            max(min(speed_level - 1, 1), 0),
+            max(min(speed_level - 2.5, 1), 0),
+            max(min(speed_level - 4, 1), 0)
+        )
+        self._last_vol_key = key
+        self._last_vols = volumes
         return volumes
 
     def close_connection(self):
-        """Closes the OBD connection if it's open."""
+        """Stops background polling and closes the OBD connection if it's open."""
+        self._stop_polling.set()
+        if self._poll_thread is not None:
+            self._poll_thread.join()
+            self._poll_thread = None
         if self.connection and self.connection.is_connected():
             self.connection.close()
             print("OBD connection closed.")
\ No newline at end of file
@@ -15,7 +15,20 @@ GREEN = (0, 200, 0)
 BLUE = (0, 0, 255)
 BACKGROUND_COLOR = (60, 60, 60)
 FONT_SIZE = 30
+HUD_CACHE_SIZE = 256 # Max rendered HUD text surfaces kept around
 FPS = 60
+PHYSICS_HZ = 120 # Fixed vehicle physics rate, independent of rendering
+PHYSICS_STEP_MS = 1000 / PHYSICS_HZ
+PHYSICS_DT = FPS / PHYSICS_HZ # Vehicle constants are tuned per 60 FPS frame
+MAX_PHYSICS_LAG_MS = 250 # Drop simulated time beyond this after a stall instead of catching up
+
+# Sim controls: key -> (Vehicle attribute, value while held, value once released)
+KEY_BINDINGS = {
+    pygame.K_UP: ("is_accelerating", True, False),
+    pygame.K_DOWN: ("is_braking", True, False),
+    pygame.K_LEFT: ("turn_direction", -1, 0),
+    pygame.K_RIGHT: ("turn_direction", 1, 0),
+}
 
 # Simulation parameters from OBD context
 MAX_RPM_OUTPUT = 7000
@@ -25,40 +38,83 @@ IDLE_RPM_OUTPUT = 800
 
 # Vehicle physics constants
 VEHICLE_MAX_SPEED_PIXELS = 6.0
+PIXEL_TO_MPH = MAX_SPEED_OUTPUT / VEHICLE_MAX_SPEED_PIXELS # Top pixel speed maps to MAX_SPEED_OUTPUT
 VEHICLE_ACCELERATION_RATE = 0.015 # Base acceleration rate
 VEHICLE_BRAKING_DECELERATION = 0.025
 VEHICLE_TURN_SPEED_DEG = 3.5
 VEHICLE_FRICTION = 0.003
+RPM_CACHE_SIZE = 8192 # Max (gear, speed bin) entries memoized by Vehicle._get_raw_rpm_for_logic
 
 # --- Gearbox Simulation Constants ---
+# Per-gear tables are tuples: fixed length, read every frame, never mutated.
 GEAR_MAX = 5
 # Factors to determine how quickly RPM rises with speed for each gear. Higher factor = lower gear (RPM rises faster for given speed).
 # This simulates the gear ratio's effect on engine RPM relative to wheel speed.
-GEAR_SPEED_RPM_FACTORS = [2.9, 2.1, 1.6, 1.2, 0.95]  # For gears 1-5 respectively
+GEAR_SPEED_RPM_FACTORS = (2.9, 2.1, 1.6, 1.2, 0.95)  # For gears 1-5 respectively
+# RPM gained per MPH in each gear: raw RPM = IDLE_RPM_OUTPUT + slope * speed
+_GEAR_RPM_SLOPE = tuple(f * (MAX_RPM_OUTPUT - IDLE_RPM_OUTPUT) / MAX_SPEED_OUTPUT for f in GEAR_SPEED_RPM_FACTORS)
 # Acceleration multiplier per gear (higher = more torque/acceleration)
-ACCELERATION_FACTOR_PER_GEAR = [1.7, 1.4, 1.1, 0.9, 0.75] # For gears 1-5
+ACCELERATION_FACTOR_PER_GEAR = (1.7, 1.4, 1.1, 0.9, 0.75) # For gears 1-5
 # RPM thresholds to consider an upshift FROM the current gear (index 0 for gear 1, etc.)
-UPSHIFT_RPM_THRESHOLDS = [5200, 5000, 4800, 4600, MAX_RPM_OUTPUT + 1] # Gear 5 doesn't upshift
+UPSHIFT_RPM_THRESHOLDS = (5200, 5000, 4800, 4600, MAX_RPM_OUTPUT + 1) # Gear 5 doesn't upshift
 # RPM thresholds to consider a downshift FROM the current gear
-DOWNSHIFT_RPM_THRESHOLDS = [IDLE_RPM_OUTPUT -1, 1800, 2000, 2200, 2400] # Gear 1 doesn't downshift further
+DOWNSHIFT_RPM_THRESHOLDS = (IDLE_RPM_OUTPUT -1, 1800, 2000, 2200, 2400) # Gear 1 doesn't downshift further
 # Minimum speed (MPH) required to comfortably operate IN a gear (index 0 for G1, 1 for G2 etc.)
 # Used to check if a target lower gear is viable during downshift.
-MIN_SPEED_FOR_GEAR_OPERATION = [0, 10, 22, 35, 50]
+MIN_SPEED_FOR_GEAR_OPERATION = (0, 10, 22, 35, 50)
 # Minimum speed (MPH) to consider an upshift FROM the current gear
-MIN_SPEED_FOR_UPSHIFT_FROM_GEAR = [8, 18, 30, 45, MAX_SPEED_OUTPUT + 1] # G5 never upshifts
+MIN_SPEED_FOR_UPSHIFT_FROM_GEAR = (8, 18, 30, 45, MAX_SPEED_OUTPUT + 1) # G5 never upshifts
+
+
+def shift_gear(gear, speed_mph, raw_rpm):
+    """Returns the gear to use next frame given the current gear, speed and raw (shifting) RPM."""
+    # Upshifting
+    if gear < GEAR_MAX and \
+       raw_rpm > UPSHIFT_RPM_THRESHOLDS[gear - 1] and \
+       speed_mph > MIN_SPEED_FOR_UPSHIFT_FROM_GEAR[gear - 1]:
+        return gear + 1
+
+    # Downshifting
+    if gear > 1:
+        rpm_too_low_for_current_gear = raw_rpm < DOWNSHIFT_RPM_THRESHOLDS[gear - 1]
+        # Check if the speed is appropriate for the TARGET lower gear (gear - 1)
+        # Target gear index is gear - 2
+        speed_ok_for_target_lower_gear = speed_mph >= MIN_SPEED_FOR_GEAR_OPERATION[gear - 2]
+
+        if rpm_too_low_for_current_gear and speed_ok_for_target_lower_gear:
+            return gear - 1
+
+    return gear
 
 
 class Vehicle(pygame.sprite.Sprite):
-    def __init__(self, x, y, angle=0.0):
+    # Fixed attribute layout for the per-frame hot path. Sprite itself has no
+    # __slots__, so instances still carry a __dict__ for the base class state.
+    __slots__ = (
+        'original_image', 'image', 'rect', '_rot_cache',
+        'px', 'py', 'vx', 'vy', 'angle',
+        'is_accelerating', 'is_braking', 'turn_direction',
+        'current_gear', 'raw_rpm', '_rpm_cache', '_gear_rpm_slope',
+        'acceleration_factor_per_gear',
+    )
+
+    def __init__(self, x, y, angle=0.0, convert_images=False):
         super().__init__()
         self.original_image = pygame.Surface([40, 20], pygame.SRCALPHA)
         self.original_image.fill(GREEN)
         pygame.draw.polygon(self.original_image, RED, [(40, 0), (40, 20), (30, 10)])
-        self.image = self.original_image
+        # Sprite pre-rotated at every whole degree; update() picks the nearest one
+        self._rot_cache = [pygame.transform.rotate(self.original_image, -a) for a in range(360)]
+        if convert_images:
+            # Match the display's pixel format so per-frame blits need no conversion.
+            # Needs a display mode, so it's opt-in and the physics work without one.
+            self._rot_cache = [image.convert_alpha() for image in self._rot_cache]
+        self.image = self._rot_cache[round(angle) % 360]
         self.rect = self.image.get_rect(center=(x, y))
 
-        self.position = pygame.math.Vector2(x, y)
-        self.velocity = pygame.math.Vector2(0, 0)
+        # Position and velocity as plain floats; Vector2 ops allocate on every call
+        self.px, self.py = float(x), float(y)
+        self.vx = self.vy = 0.0
         self.angle = angle
         
         self.is_accelerating = False
@@ -67,116 +123,109 @@ class Vehicle(pygame.sprite.Sprite):
 
         # Gearbox state
         self.current_gear = 1
-        # Assign constants to instance for easier access if needed, though direct use is fine
-        self.gear_speed_rpm_factors = GEAR_SPEED_RPM_FACTORS
+        # Per-gear tables read by the RPM and acceleration code; shift thresholds live in shift_gear
+        self._gear_rpm_slope = _GEAR_RPM_SLOPE
         self.acceleration_factor_per_gear = ACCELERATION_FACTOR_PER_GEAR
-        self.upshift_rpm_thresholds = UPSHIFT_RPM_THRESHOLDS
-        self.downshift_rpm_thresholds = DOWNSHIFT_RPM_THRESHOLDS
-        self.min_speed_for_gear_operation = MIN_SPEED_FOR_GEAR_OPERATION
-        self.min_speed_for_upshift_from_gear = MIN_SPEED_FOR_UPSHIFT_FROM_GEAR
+        # Raw RPM memo keyed by (gear, speed in 0.1 MPH bins)
+        self._rpm_cache = {}
+        self.raw_rpm = IDLE_RPM_OUTPUT
 
 
     def update(self, dt=1):
+        # Parked with no input: nothing moves, so only the gearbox can still settle
+        if not (self.is_accelerating or self.is_braking or self.turn_direction) and \
+           self.vx == 0 == self.vy:
+            self.current_gear = shift_gear(self.current_gear, 0.0, IDLE_RPM_OUTPUT)
+            self.raw_rpm = IDLE_RPM_OUTPUT
+            return
+
         # --- Handle Turning ---
         if self.turn_direction != 0:
             self.angle += self.turn_direction * VEHICLE_TURN_SPEED_DEG * dt
             self.angle %= 360
 
         # --- Handle Acceleration/Braking ---
-        effective_accel_rate = 0
         if self.is_accelerating:
-            # Apply gear-based acceleration modification
-            effective_accel_rate = VEHICLE_ACCELERATION_RATE * self.acceleration_factor_per_gear[self.current_gear-1]
-        
-        rad_angle = math.radians(self.angle)
-        forward_vector = pygame.math.Vector2(math.cos(rad_angle), math.sin(rad_angle))
-        self.velocity += forward_vector * effective_accel_rate * dt
-
-        if self.is_braking:
-            if self.velocity.length() > 0.01:
-                brake_val = VEHICLE_BRAKING_DECELERATION * dt
-                if self.velocity.length() < brake_val: self.velocity.xy = (0,0)
-                else: self.velocity -= self.velocity.normalize() * brake_val
-            else: self.velocity.xy = (0,0)
-
-        # --- Apply Friction ---
-        if not self.is_accelerating and self.velocity.length() > 0:
-            friction_force = self.velocity.length() * VEHICLE_FRICTION * dt
-            if self.velocity.length() < friction_force: self.velocity.xy = (0,0)
-            else: self.velocity -= self.velocity.normalize() * friction_force
-        
-        if self.velocity.length() > VEHICLE_MAX_SPEED_PIXELS:
-            self.velocity.scale_to_length(VEHICLE_MAX_SPEED_PIXELS)
-
-        self.position += self.velocity * dt
-        
-        # Screen Wrap
-        if self.position.x > SCREEN_WIDTH: self.position.x = 0
-        if self.position.x < 0: self.position.x = SCREEN_WIDTH
-        if self.position.y > SCREEN_HEIGHT: self.position.y = 0
-        if self.position.y < 0: self.position.y = SCREEN_HEIGHT
+            # Apply gear-based acceleration modification along the heading
+            rad_angle = math.radians(self.angle)
+            accel = VEHICLE_ACCELERATION_RATE * self.acceleration_factor_per_gear[self.current_gear-1] * dt
+            self.vx += math.cos(rad_angle) * accel
+            self.vy += math.sin(rad_angle) * accel
+
+        # --- Braking, Friction and Speed Cap, applied as one rescale of the velocity ---
+        speed = math.hypot(self.vx, self.vy)
+        if speed > 0:
+            decel = 0.0
+            if self.is_braking:
+                # Below 0.01 the brakes bring the vehicle to a full stop
+                decel = VEHICLE_BRAKING_DECELERATION * dt if speed > 0.01 else speed
+            if not self.is_accelerating:
+                decel += speed * VEHICLE_FRICTION * dt
+            scale = min(max(speed - decel, 0.0), VEHICLE_MAX_SPEED_PIXELS) / speed
+            self.vx *= scale
+            self.vy *= scale
+
+        # Screen Wrap (Python's modulo keeps negative positions in range too)
+        self.px = (self.px + self.vx * dt) % SCREEN_WIDTH
+        self.py = (self.py + self.vy * dt) % SCREEN_HEIGHT
         
         # --- Automatic Gear Shifting ---
         current_speed_mph = self.get_speed_mph() # Speed after physics update
         # Use a "raw" RPM for shifting logic, without the cosmetic acceleration bonus
         raw_rpm_for_shifting = self._get_raw_rpm_for_logic(current_speed_mph)
 
-        # Upshifting
-        if self.current_gear < GEAR_MAX and \
-           raw_rpm_for_shifting > self.upshift_rpm_thresholds[self.current_gear - 1] and \
-           current_speed_mph > self.min_speed_for_upshift_from_gear[self.current_gear - 1]:
-            self.current_gear += 1
-            # print(f"Shifted UP to G{self.current_gear} at RPM {raw_rpm_for_shifting:.0f}, Speed {current_speed_mph:.0f}")
-
-        # Downshifting
-        elif self.current_gear > 1:
-            rpm_too_low_for_current_gear = raw_rpm_for_shifting < self.downshift_rpm_thresholds[self.current_gear - 1]
-            # Check if the speed is appropriate for the TARGET lower gear (current_gear - 1)
-            # Target gear index is self.current_gear - 2
-            speed_ok_for_target_lower_gear = current_speed_mph >= self.min_speed_for_gear_operation[self.current_gear - 2]
-
-            if rpm_too_low_for_current_gear and speed_ok_for_target_lower_gear:
-                self.current_gear -= 1
-                # print(f"Shifted DOWN to G{self.current_gear} at RPM {raw_rpm_for_shifting:.0f}, Speed {current_speed_mph:.0f}")
-        
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
-        self.rect = self.image.get_rect(center=self.position)
+        new_gear = shift_gear(self.current_gear, current_speed_mph, raw_rpm_for_shifting)
+        if new_gear != self.current_gear:
+            self.current_gear = new_gear
+            raw_rpm_for_shifting = self._get_raw_rpm_for_logic(current_speed_mph)
+            # print(f"Shifted to G{self.current_gear} at RPM {raw_rpm_for_shifting:.0f}, Speed {current_speed_mph:.0f}")
+
+        # Raw RPM in the (possibly new) gear, reused by get_rpm this frame
+        self.raw_rpm = raw_rpm_for_shifting
+
+        self.image = self._rot_cache[round(self.angle) % 360]
+        self.rect = self.image.get_rect(center=(self.px, self.py))
 
     def get_speed_mph(self):
-        if VEHICLE_MAX_SPEED_PIXELS == 0: return 0
-        normalized_pixel_speed = self.velocity.length() / VEHICLE_MAX_SPEED_PIXELS
-        return normalized_pixel_speed * MAX_SPEED_OUTPUT
+        return math.hypot(self.vx, self.vy) * PIXEL_TO_MPH
 
     def _get_raw_rpm_for_logic(self, speed_mph_param=None):
         """Calculates RPM based purely on speed and gear, for shifting logic."""
         current_speed_mph = speed_mph_param if speed_mph_param is not None else self.get_speed_mph()
 
+        # Quantize speed to 0.1 MPH so nearby frames share a cached result
+        speed_bin = int(current_speed_mph * 10)
+        key = (self.current_gear, speed_bin)
+        rpm = self._rpm_cache.get(key)
+        if rpm is not None:
+            return rpm
+        current_speed_mph = speed_bin * 0.1
+
         if current_speed_mph < 0.5: # Consistent with get_rpm's idle condition
-            return IDLE_RPM_OUTPUT
+            rpm = IDLE_RPM_OUTPUT
+            self._cache_raw_rpm(key, rpm)
+            return rpm
+
+        # RPM rises linearly from idle with speed; the slope folds in the gear factor
+        # (higher factor = lower gear = RPM rises faster for given speed).
+        # With a gear factor of 1.0 the engine reaches MAX_RPM_OUTPUT at MAX_SPEED_OUTPUT.
+        rpm = IDLE_RPM_OUTPUT + self._gear_rpm_slope[self.current_gear - 1] * current_speed_mph
 
-        # Factor determines how quickly RPM rises with speed for this gear.
-        # Higher factor = lower gear (RPM rises faster for given speed).
-        gear_idx = self.current_gear - 1
-        gear_factor = self.gear_speed_rpm_factors[gear_idx]
-        
-        # RPM calculation:
-        # normalized_speed_in_gear_context represents how "far" into the RPM range the current speed is,
-        # considering the gear's specific RPM-to-speed relationship.
-        # If gear_factor = 1.0, at MAX_SPEED_OUTPUT, normalized_speed = 1.0.
-        # If gear_factor = 2.0 (lower gear), at MAX_SPEED_OUTPUT/2.0, normalized_speed = 1.0.
-        normalized_speed_in_gear_context = (current_speed_mph * gear_factor) / MAX_SPEED_OUTPUT
-        
-        rpm = IDLE_RPM_OUTPUT + normalized_speed_in_gear_context * (MAX_RPM_OUTPUT - IDLE_RPM_OUTPUT)
-        
         # Clamp for logic, allow slight over-rev possibility before final clamping in get_rpm
-        rpm = min(max(rpm, MIN_RPM_OUTPUT), MAX_RPM_OUTPUT + 500) 
-        if current_speed_mph < 0.5: rpm = IDLE_RPM_OUTPUT # Ensure idle at very low speed
+        rpm = min(max(rpm, MIN_RPM_OUTPUT), MAX_RPM_OUTPUT + 500)
+        self._cache_raw_rpm(key, rpm)
         return rpm
 
-    def get_rpm(self): # This is the RPM value used by OBDHandler for audio modulation
+    def _cache_raw_rpm(self, key, rpm):
+        if len(self._rpm_cache) >= RPM_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._rpm_cache[next(iter(self._rpm_cache))]
+        self._rpm_cache[key] = rpm
+
+    def get_rpm(self, raw_rpm=None): # This is the RPM value used by OBDHandler for audio modulation
         current_speed_mph = self.get_speed_mph()
-        # Get base RPM from speed and current gear
-        rpm = self._get_raw_rpm_for_logic(current_speed_mph)
+        # Get base RPM from speed and current gear, unless update() already computed it
+        rpm = raw_rpm if raw_rpm is not None else self._get_raw_rpm_for_logic(current_speed_mph)
 
         # Add a flare/bonus to RPM when accelerating, scaled by gear's torque
         if self.is_accelerating and current_speed_mph < MAX_SPEED_OUTPUT * 0.98 and rpm < MAX_RPM_OUTPUT:
@@ -218,7 +267,8 @@ def main():
         pygame.quit()
         return
 
-    file_paths = [os.path.join(path, file) for file in os.listdir(path) if file.lower().endswith(".wav")]
+    # Sorted so stems map to mixer channels in a stable order (bass, drums, other, vocals)
+    file_paths = sorted(entry.path for entry in os.scandir(path) if entry.is_file() and entry.name.lower().endswith(".wav"))
     if not file_paths:
         print(f"No .wav files found in '{path}'.")
         pygame.quit()
@@ -247,75 +297,108 @@ def main():
         
     simulation_active = handler.simulate
 
-    player_vehicle = Vehicle(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, angle=-90)
-    all_sprites = pygame.sprite.Group()
-    all_sprites.add(player_vehicle)
-
+    player_vehicle = Vehicle(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, angle=-90, convert_images=True)
+
+    # Rendered HUD text, keyed by what the text shows so unchanged readings skip font.render
+    hud_cache = {}
+
+    def render_cached(key, text, color=WHITE):
+        surface = hud_cache.get(key)
+        if surface is None:
+            if len(hud_cache) >= HUD_CACHE_SIZE:
+                del hud_cache[next(iter(hud_cache))] # Drop the oldest entry
+            surface = font.render(text, True, color).convert_alpha()
+            hud_cache[key] = surface
+        return surface
+
+    # Background with the labels that never change in this mode, blitted once per frame
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(BACKGROUND_COLOR)
+    if simulation_active:
+        background.blit(font.render("Mode: Sim (Vehicle w/ Gearbox)", True, WHITE), (20, 140))
+        background.blit(font.render("Controls: Arrow Keys", True, WHITE), (20, SCREEN_HEIGHT - 40))
+
+    # Only quit, key and window-expose events are handled; drop everything else at the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
+    pygame.event.clear() # Anything queued before the filter was set
+
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+
+    applied_volumes = None
+    physics_time_ms = 0.0
+    drawn = [] # (surface, position) pairs on screen, used to find what needs redrawing
+    drawn_rects = []
     running = True
     try:
         while running:
+            elapsed_ms = clock.tick(FPS)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-                if simulation_active:
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    # The window contents may have been lost: restore the full background
+                    # and forget what was drawn so the next frame repaints everything
+                    screen.blit(background, (0, 0))
+                    pygame.display.flip()
+                    drawn = []
+                    drawn_rects = []
+                elif simulation_active and event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key in KEY_BINDINGS:
+                    attr, held_value, released_value = KEY_BINDINGS[event.key]
                     if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_UP: player_vehicle.is_accelerating = True
-                        elif event.key == pygame.K_DOWN: player_vehicle.is_braking = True
-                        elif event.key == pygame.K_LEFT: player_vehicle.turn_direction = -1
-                        elif event.key == pygame.K_RIGHT: player_vehicle.turn_direction = 1
-                    if event.type == pygame.KEYUP:
-                        if event.key == pygame.K_UP: player_vehicle.is_accelerating = False
-                        elif event.key == pygame.K_DOWN: player_vehicle.is_braking = False
-                        elif event.key == pygame.K_LEFT and player_vehicle.turn_direction == -1: player_vehicle.turn_direction = 0
-                        elif event.key == pygame.K_RIGHT and player_vehicle.turn_direction == 1: player_vehicle.turn_direction = 0
+                        setattr(player_vehicle, attr, held_value)
+                    elif getattr(player_vehicle, attr) == held_value:
+                        # Left/Right share turn_direction, so only release the key that set it
+                        setattr(player_vehicle, attr, released_value)
             
             if simulation_active:
-                all_sprites.update() 
+                physics_time_ms = min(physics_time_ms + elapsed_ms, MAX_PHYSICS_LAG_MS)
+                while physics_time_ms >= PHYSICS_STEP_MS:
+                    player_vehicle.update(PHYSICS_DT)
+                    physics_time_ms -= PHYSICS_STEP_MS
                 sim_speed = player_vehicle.get_speed_mph()
-                sim_rpm = player_vehicle.get_rpm()
+                sim_rpm = player_vehicle.get_rpm(player_vehicle.raw_rpm)
                 handler.refresh(sim_speed=sim_speed, sim_rpm=sim_rpm)
             else:
                 handler.refresh() 
 
             volume_list = handler.get_volumes()
-            loop.adjust_volumes(volume_list)
+            if volume_list != applied_volumes: # Don't push unchanged volumes to the mixer
+                loop.adjust_volumes(volume_list)
+                applied_volumes = volume_list
 
-            screen.fill(BACKGROUND_COLOR)
+            frame = []
             if simulation_active:
-                all_sprites.draw(screen)
-            
-            display_speed = handler.get_speed()
-            display_rpm = handler.get_rpm()
+                frame.append((player_vehicle.image, player_vehicle.rect))
+
+            # Rounded the same way the old :.0f formatting did
+            display_speed = round(handler.get_speed())
+            display_rpm = round(handler.get_rpm())
 
-            speed_text_surface = font.render(f"Speed: {display_speed:.0f} MPH", True, WHITE)
-            rpm_text_surface = font.render(f"RPM: {display_rpm:.0f}", True, WHITE)
-            screen.blit(speed_text_surface, (20, 20))
-            screen.blit(rpm_text_surface, (20, 60))
+            frame.append((render_cached(("spd", display_speed), f"Speed: {display_speed} MPH"), (20, 20)))
+            frame.append((render_cached(("rpm", display_rpm), f"RPM: {display_rpm}"), (20, 60)))
 
             if simulation_active:
-                gear_text_surface = font.render(f"Gear: {player_vehicle.current_gear}", True, WHITE)
-                screen.blit(gear_text_surface, (20, 100)) # Adjusted Y position
+                gear_text_surface = render_cached(("gear", player_vehicle.current_gear), f"Gear: {player_vehicle.current_gear}")
+                frame.append((gear_text_surface, (20, 100))) # Adjusted Y position
 
-            mode_y_pos = 140 if simulation_active else 100
-            mode_text_str = "Mode: Sim (Vehicle w/ Gearbox)" if simulation_active else "Mode: OBD"
-            mode_color = WHITE
             if not simulation_active:
+                # The OBD mode label follows the connection state, so it can't live on the background
                 if handler.connection and handler.connection.is_connected():
-                    mode_text_str += " (Connected)"
-                    mode_color = GREEN
+                    mode_surface = render_cached(("mode", True), "Mode: OBD (Connected)", GREEN)
                 else:
-                    mode_text_str += " (Disconnected)"
-                    mode_color = RED
-            
-            mode_surface = font.render(mode_text_str, True, mode_color)
-            screen.blit(mode_surface, (20, mode_y_pos))
-
-            if simulation_active:
-                instr_surface = font.render("Controls: Arrow Keys", True, WHITE)
-                screen.blit(instr_surface, (20, SCREEN_HEIGHT - 40))
-            
-            pygame.display.flip()
-            clock.tick(FPS)
+                    mode_surface = render_cached(("mode", False), "Mode: OBD (Disconnected)", RED)
+                frame.append((mode_surface, (20, 100)))
+
+            # Redraw only when something moved or changed, and only push those areas to the display
+            if frame != drawn:
+                for rect in drawn_rects:
+                    screen.blit(background, rect, rect)
+                new_rects = [screen.blit(surface, position) for surface, position in frame]
+                pygame.display.update(drawn_rects + new_rects)
+                drawn = frame
+                drawn_rects = new_rects
 
     except KeyboardInterrupt:
         print("\nExiting program...")